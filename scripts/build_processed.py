@@ -0,0 +1,46 @@
+"""
+Script to precompute processed trip data and quarterly summaries at build time
+
+Run after convert_csv_to_parquet.py; the dashboard then loads the two Feather
+files directly instead of processing the Parquet files on a cold start. Every
+page, the data explorer included, works from these two files, so a deployment
+only needs to ship them and not the Parquet dataset.
+
+The build always reprocesses the Parquet files: the data/cache Feather file is
+neither read nor written, so a stale cache can never end up in the output.
+"""
+
+from pathlib import Path
+import sys
+import time
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from config import DATA_DIR, PROCESSED_FILE, SUMMARY_FILE
+from data_loader import DataLoader
+
+
+def main():
+    """Run the full pipeline once and write its output next to the data"""
+
+    if not any(DATA_DIR.rglob("*.parquet")):
+        print(f"No Parquet files found in {DATA_DIR}")
+        print("Run scripts/convert_csv_to_parquet.py first")
+        return
+
+    start = time.perf_counter()
+    processed_data = DataLoader.build_processed_data(DATA_DIR)
+    summary_data = DataLoader.generate_quarterly_summary(processed_data)
+    elapsed = time.perf_counter() - start
+    print(f"Processed {len(processed_data):,} trips in {elapsed:.1f}s")
+
+    PROCESSED_FILE.parent.mkdir(parents=True, exist_ok=True)
+    processed_data.to_feather(PROCESSED_FILE, compression="zstd")
+    summary_data.to_feather(SUMMARY_FILE, compression="zstd")
+
+    for path in (PROCESSED_FILE, SUMMARY_FILE):
+        print(f"Wrote {path} ({path.stat().st_size / (1024 * 1024):.2f} MB)")
+
+
+if __name__ == "__main__":
+    main()
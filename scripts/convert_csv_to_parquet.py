@@ -2,46 +2,123 @@
 Script to convert CSV files to Parquet format for better performance and storage efficiency
 """
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 from pathlib import Path
+import re
 import sys
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-from config import DATA_DIR
+from config import DATA_DIR, YEAR_PARTITIONING
+
+# Parse trip timestamps while reading so they are stored natively in Parquet.
+# Text columns are typed explicitly: open_csv infers types from the first block
+# only, so a later non-numeric bike_id would otherwise fail the conversion.
+CSV_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    column_types={
+        'start_time': pa.timestamp('ns'),
+        'end_time': pa.timestamp('ns'),
+        'bike_id': pa.string(),
+        'trip_route_category': pa.string(),
+        'passholder_type': pa.string(),
+        'bike_type': pa.string(),
+    },
+    timestamp_parsers=[pacsv.ISO8601, '%m/%d/%Y %H:%M', '%m/%d/%Y %H:%M:%S'],
+    # Empty cells are missing values, not "" categories
+    strings_can_be_null=True,
+)
+
+
+def remove_partition_files(csv_path: Path, output_dir: Path) -> None:
+    """
+    Delete the year=*/<stem>-<i>.parquet files written for one CSV file
 
+    Args:
+        csv_path: Path to the CSV file the Parquet files were converted from
+        output_dir: Root directory of the year-partitioned Parquet dataset
+    """
+    file_name = re.compile(rf'{re.escape(csv_path.stem)}-\d+\.parquet')
+    for path in output_dir.glob('year=*/*.parquet'):
+        if file_name.fullmatch(path.name):
+            path.unlink()
 
-def convert_csv_to_parquet(csv_path: Path, parquet_path: Path) -> dict:
+
+def convert_csv_to_parquet(csv_path: Path, output_dir: Path) -> dict:
     """
-    Convert a single CSV file to Parquet format
+    Convert a single CSV file to Parquet files partitioned by year
 
     Args:
         csv_path: Path to input CSV file
-        parquet_path: Path to output Parquet file
+        output_dir: Root directory of the year-partitioned Parquet dataset
 
     Returns:
         Dictionary with conversion statistics
     """
     print(f"Converting {csv_path.name}...")
 
-    # Read CSV
-    df = pd.read_csv(csv_path, low_memory=False)
+    # Stream the CSV in 64 MB blocks so memory stays bounded by one block
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=64 << 20),
+        convert_options=CSV_CONVERT_OPTIONS,
+    )
+    schema = reader.schema.append(YEAR_PARTITIONING.schema.field('year'))
+    rows = 0
+
+    def with_year():
+        """Add the partition key to each parsed block"""
+        nonlocal rows
+        for batch in reader:
+            rows += batch.num_rows
+            year = pc.year(batch.column('start_time')).cast(pa.int16())
+            yield pa.RecordBatch.from_arrays(batch.columns + [year], schema=schema)
 
     # Get file sizes
     csv_size = csv_path.stat().st_size
 
-    # Write to Parquet with compression
-    df.to_parquet(parquet_path, engine='pyarrow', compression='snappy', index=False)
+    # Drop this CSV's files from an earlier run: a re-conversion may write
+    # fewer files or other years, and leftovers would be read twice
+    remove_partition_files(csv_path, output_dir)
+
+    # Write one directory per year while the CSV is still being parsed
+    parquet_format = ds.ParquetFileFormat()
+    written = []
+    try:
+        ds.write_dataset(
+            pa.RecordBatchReader.from_batches(schema, with_year()),
+            output_dir,
+            format=parquet_format,
+            partitioning=YEAR_PARTITIONING,
+            basename_template=f'{csv_path.stem}-{{i}}.parquet',
+            existing_data_behavior='overwrite_or_ignore',
+            max_rows_per_file=1_000_000,
+            max_rows_per_group=512_000,
+            file_options=parquet_format.make_write_options(
+                compression='zstd',
+                compression_level=3,
+                use_dictionary=True,
+                data_page_size=1 << 20,
+                write_statistics=['start_time', 'duration', 'start_station'],
+            ),
+            file_visitor=lambda written_file: written.append(Path(written_file.path)),
+        )
+    except Exception:
+        # Don't leave a partial conversion behind to be read as complete data
+        remove_partition_files(csv_path, output_dir)
+        raise
 
     # Get parquet size
-    parquet_size = parquet_path.stat().st_size
+    parquet_size = sum(path.stat().st_size for path in written)
 
     # Calculate savings
     size_reduction = ((csv_size - parquet_size) / csv_size) * 100
 
     stats = {
         'file': csv_path.name,
-        'rows': len(df),
+        'rows': rows,
         'csv_size_mb': csv_size / (1024 * 1024),
         'parquet_size_mb': parquet_size / (1024 * 1024),
         'size_reduction_pct': size_reduction
@@ -73,11 +150,11 @@ def main():
     # Convert each file
     all_stats = []
     for csv_path in csv_files:
-        parquet_path = csv_path.with_suffix('.parquet')
-
         try:
-            stats = convert_csv_to_parquet(csv_path, parquet_path)
+            stats = convert_csv_to_parquet(csv_path, DATA_DIR)
             all_stats.append(stats)
+            # Only now remove the flat file the previous (unpartitioned) layout wrote
+            csv_path.with_suffix('.parquet').unlink(missing_ok=True)
         except Exception as e:
             print(f"Error converting {csv_path.name}: {e}")
             continue
@@ -2,9 +2,12 @@
 Indego Bike Share Analytics Dashboard - Main Application
 """
 
+import io
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pathlib import Path
 import sys
 
@@ -39,6 +42,60 @@ def get_visualizer():
     return Visualizer()
 
 
+@st.cache_data(show_spinner=False)
+def get_duration_stats(processed_data: pd.DataFrame) -> dict:
+    """Summarize trip durations once per dataset instead of on every rerun"""
+    return MetricsCalculator.calculate_duration_stats(processed_data)
+
+
+@st.cache_data(show_spinner=False)
+def get_peak_times(processed_data: pd.DataFrame) -> dict:
+    """Identify peak usage times once per dataset instead of on every rerun"""
+    return MetricsCalculator.calculate_peak_times(processed_data)
+
+
+@st.cache_data(ttl=3600, max_entries=4, show_spinner="Preparing download...")
+def encode_download(
+    _data: pd.DataFrame, _mask: np.ndarray, file_format: str, cache_key: tuple
+) -> bytes:
+    """
+    Encode filtered trip data for download, cached per filter selection
+
+    Only the last few exports are kept, since each one can be hundreds of MB.
+
+    Args:
+        _data: DataFrame to encode rows from (not hashed)
+        _mask: Boolean mask of the rows to include (not hashed)
+        file_format: Either "CSV" or "Parquet"
+        cache_key: Hashable description of the filters that produced _mask
+
+    Returns:
+        Encoded file contents
+    """
+    data = _data[_mask]
+    buffer = io.BytesIO()
+
+    if file_format == "Parquet":
+        data.to_parquet(buffer, engine="pyarrow", compression="zstd", index=False)
+    else:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        # Trip times are whole seconds; avoid a nanosecond suffix in the CSV
+        table = table.cast(
+            pa.schema(
+                [
+                    field.with_type(pa.timestamp("s"))
+                    if pa.types.is_timestamp(field.type)
+                    else field
+                    for field in table.schema
+                ]
+            ),
+            safe=False,
+        )
+        pacsv.write_csv(table, buffer)
+
+    return buffer.getvalue()
+
+
 def load_and_process_data():
     """Load and process all data"""
     loader = get_data_loader()
@@ -158,7 +215,9 @@ def render_time_series_analysis(summary_data: pd.DataFrame, visualizer: Visualiz
     st.divider()
 
 
-def render_growth_analysis(summary_data: pd.DataFrame, visualizer: Visualizer):
+def render_growth_analysis(
+    summary_data: pd.DataFrame, growth_metrics: dict, visualizer: Visualizer
+):
     """Render growth analysis section"""
     st.header("Growth Analysis")
 
@@ -168,9 +227,6 @@ def render_growth_analysis(summary_data: pd.DataFrame, visualizer: Visualizer):
 
     st.markdown("### Growth Metrics Summary")
 
-    calc = MetricsCalculator()
-    growth_metrics = calc.calculate_growth_metrics(summary_data)
-
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric(
@@ -205,6 +261,9 @@ def render_usage_patterns(
     """Render usage patterns analysis section"""
     st.header("Usage Patterns Analysis")
 
+    # Shared by the hourly and daily tabs
+    peak_times = get_peak_times(processed_data)
+
     tab1, tab2, tab3 = st.tabs(["Hourly Patterns", "Daily Patterns", "Monthly Heatmap"])
 
     with tab1:
@@ -213,7 +272,6 @@ def render_usage_patterns(
         fig = visualizer.plot_hourly_patterns(hourly_data)
         st.pyplot(fig)
 
-        peak_times = MetricsCalculator.calculate_peak_times(processed_data)
         st.info(
             f"**Peak Hour:** {peak_times['peak_hour']}:00 with "
             f"{peak_times['peak_hour_trips']:,} trips"
@@ -225,7 +283,6 @@ def render_usage_patterns(
         fig = visualizer.plot_daily_patterns(daily_data)
         st.pyplot(fig)
 
-        peak_times = MetricsCalculator.calculate_peak_times(processed_data)
         st.info(
             f"**Peak Day:** {peak_times['peak_day']} with "
             f"{peak_times['peak_day_trips']:,} trips"
@@ -295,19 +352,17 @@ def render_advanced_metrics(
     with tab1:
         st.markdown("### Trip Duration Distribution")
 
+        duration_stats = get_duration_stats(processed_data)
+
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Mean Duration", f"{processed_data['duration'].mean():.1f} min")
+            st.metric("Mean Duration", f"{duration_stats['mean']:.1f} min")
         with col2:
-            st.metric(
-                "Median Duration", f"{processed_data['duration'].median():.1f} min"
-            )
+            st.metric("Median Duration", f"{duration_stats['median']:.1f} min")
         with col3:
-            st.metric(
-                "Mode Duration", f"{processed_data['duration'].mode()[0]:.0f} min"
-            )
+            st.metric("Mode Duration", f"{duration_stats['mode']:.0f} min")
         with col4:
-            st.metric("Max Duration", f"{processed_data['duration'].max():.1f} min")
+            st.metric("Max Duration", f"{duration_stats['max']:.1f} min")
 
         fig = visualizer.plot_duration_distribution(processed_data)
         st.pyplot(fig)
@@ -355,39 +410,49 @@ def render_data_explorer(
                 "Day Type", day_types, default=day_types
             )
 
-        # Filter data
-        filtered_data = loader.filter_data(
+        # Filter data (only a row mask; rows are copied when actually needed)
+        mask = loader.filter_mask(
             processed_data,
             years=selected_years if selected_years else None,
             quarters=selected_quarters if selected_quarters else None,
             day_types=selected_day_types if selected_day_types else None,
         )
 
-        st.markdown(f"**Showing {len(filtered_data):,} trips**")
-
-        # Display sample
+        st.markdown(f"**Showing {int(mask.sum()):,} trips**")
+
+        # Display sample (only the first 1000 matching rows are gathered)
+        display_columns = [
+            "start_time",
+            "end_time",
+            "duration",
+            "start_station",
+            "end_station",
+            "bike_id",
+            "year_quarter",
+        ]
         st.dataframe(
-            filtered_data.head(1000)[
-                [
-                    "start_time",
-                    "end_time",
-                    "duration",
-                    "start_station",
-                    "end_station",
-                    "bike_id",
-                    "year_quarter",
-                ]
-            ],
+            processed_data.iloc[np.flatnonzero(mask)[:1000]][display_columns],
             use_container_width=True,
         )
 
-        # Download button
-        csv = filtered_data.to_csv(index=False)
+        # Download button (encoded once per filter selection and format)
+        file_format = st.radio("Download format", ["CSV", "Parquet"], horizontal=True)
+        download = encode_download(
+            processed_data,
+            mask,
+            file_format,
+            (
+                tuple(sorted(selected_years)),
+                tuple(sorted(selected_quarters)),
+                tuple(sorted(selected_day_types)),
+                loader.data_version,
+            ),
+        )
         st.download_button(
-            label="Download Filtered Data as CSV",
-            data=csv,
-            file_name="indego_filtered_trips.csv",
-            mime="text/csv",
+            label=f"Download Filtered Data as {file_format}",
+            data=download,
+            file_name=f"indego_filtered_trips.{file_format.lower()}",
+            mime="text/csv" if file_format == "CSV" else "application/octet-stream",
         )
 
     with tab2:
@@ -526,7 +591,7 @@ def main():
     # Render main content sections
     render_kpi_cards(kpis, growth_metrics)
     render_time_series_analysis(summary_data, viz)
-    render_growth_analysis(summary_data, viz)
+    render_growth_analysis(summary_data, growth_metrics, viz)
     render_usage_patterns(processed_data, viz)
     render_station_analysis(processed_data, viz)
     render_advanced_metrics(processed_data, summary_data, viz)
@@ -2,18 +2,58 @@
 Configuration constants for Indego Bike Share Dashboard
 """
 
+import os
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.dataset as ds
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data" / "parquet"
+
+# Hive-style year=YYYY/ directories under DATA_DIR, shared by the converter
+# (scripts/convert_csv_to_parquet.py) and DataLoader.load_data
+YEAR_PARTITIONING = ds.partitioning(pa.schema([("year", pa.int16())]), flavor="hive")
+
 CSV_DIR = PROJECT_ROOT / "data" / "csv"
+CACHE_DIR = PROJECT_ROOT / "data" / "cache"
+
+# Pipeline output precomputed at build time by scripts/build_processed.py
+PROCESSED_FILE = PROJECT_ROOT / "data" / "processed.feather"
+SUMMARY_FILE = PROJECT_ROOT / "data" / "summary.feather"
 IMAGES_DIR = PROJECT_ROOT / "images"
 
+# Columns read from the trip Parquet files (others are never decoded)
+TRIP_COLUMNS = [
+    "trip_id",
+    "start_time",
+    "end_time",
+    "duration",
+    "bike_id",
+    "start_station",
+    "end_station",
+    "passholder_type",
+]
+
+# Opt-in Polars fast path for loading and processing (used when installed)
+USE_POLARS = os.getenv("FAST_IO") == "1"
+
 # Data validation constraints
 MIN_TRIP_DURATION = 1  # minutes
 MAX_TRIP_DURATION = 1440  # 24 hours in minutes
 
+# Day names indexed by day of week (0=Monday, 6=Sunday)
+DAY_NAMES = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
 # App configuration
 APP_TITLE = "Indego Bike Share Analytics Dashboard"
 APP_ICON = "🚴"
@@ -2,12 +2,253 @@
 Data loading and processing module for Indego Bike Share data
 """
 
+import hashlib
+import os
+import tempfile
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 from pathlib import Path
 from typing import List, Tuple
 import streamlit as st
-from config import DATA_DIR, MIN_TRIP_DURATION, MAX_TRIP_DURATION
+from kernels import temporal_features
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+from config import (
+    DATA_DIR,
+    YEAR_PARTITIONING,
+    CACHE_DIR,
+    PROCESSED_FILE,
+    SUMMARY_FILE,
+    TRIP_COLUMNS,
+    MIN_TRIP_DURATION,
+    MAX_TRIP_DURATION,
+    DAY_NAMES,
+    USE_POLARS,
+)
+
+
+def _unify_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    """
+    Merge per-file Parquet schemas into one schema every file can be cast to
+
+    Args:
+        schemas: Schemas read from each Parquet file footer
+
+    Returns:
+        Unified schema (conflicting non-numeric columns fall back to strings)
+    """
+    try:
+        return pa.unify_schemas(schemas, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    fields = {}
+    for schema in schemas:
+        for field in schema:
+            known = fields.get(field.name)
+            if known is None or known.equals(field.type):
+                fields[field.name] = field.type
+            elif all(pa.types.is_integer(t) for t in (known, field.type)):
+                fields[field.name] = pa.int64()
+            elif all(
+                pa.types.is_integer(t) or pa.types.is_floating(t)
+                for t in (known, field.type)
+            ):
+                fields[field.name] = pa.float64()
+            else:
+                fields[field.name] = pa.string()
+
+    return pa.schema(list(fields.items()))
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing-window sum computed from cumulative-sum differences
+
+    Args:
+        values: Values in chronological order
+        window: Number of trailing values per sum
+
+    Returns:
+        Float array of window sums, NaN until the first full window
+    """
+    totals = np.concatenate([[0.0], np.cumsum(values, dtype=np.float64)])
+    rolled = np.full(len(values), np.nan)
+    rolled[window - 1 :] = totals[window:] - totals[:-window]
+    return rolled
+
+
+def _period_labels(
+    years: np.ndarray, periods: np.ndarray, per_year: int, label: str
+) -> pd.Categorical:
+    """
+    Build a chronologically ordered categorical of period labels
+
+    Each label is formatted once per category instead of once per row.
+
+    Args:
+        years: Year of each row
+        periods: 1-based period within the year (quarter or month) of each row
+        per_year: Number of periods in a year
+        label: Format string taking (year, period)
+
+    Returns:
+        Categorical of period labels such as "2024-Q3" or "2024-07"
+    """
+    first_year = int(years.min()) if len(years) else 0
+    last_year = int(years.max()) if len(years) else -1
+
+    categories = [
+        label.format(year, period)
+        for year in range(first_year, last_year + 1)
+        for period in range(1, per_year + 1)
+    ]
+    codes = (years - first_year) * per_year + (periods - 1)
+
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+def _processed_cache_path(data_dir: Path) -> Path:
+    """
+    Locate the Feather cache file for the processed data of a data directory
+
+    The name starts with a digest of the data directory itself, so each
+    directory's cache files can be told apart, followed by a digest of every
+    input Parquet file (path, size and mtime), of the modules the processing
+    depends on (this one, config.py for the duration bounds and kernels.py)
+    and of the FAST_IO switch, so any change to the inputs or the processing
+    code points at a new file.
+
+    Args:
+        data_dir: Path to directory containing Parquet files
+
+    Returns:
+        Path of the Feather cache file (which may not exist yet)
+    """
+    digest = hashlib.sha1(f"polars={USE_POLARS and pl is not None};".encode())
+    for name in ("data_loader.py", "config.py", "kernels.py"):
+        mtime = Path(__file__).with_name(name).stat().st_mtime_ns
+        digest.update(f"{name}:{mtime};".encode())
+    for path in sorted(data_dir.rglob("*.parquet")):
+        stat = path.stat()
+        digest.update(
+            f"{path.relative_to(data_dir)}:{stat.st_size}:{stat.st_mtime_ns};".encode()
+        )
+
+    dir_key = hashlib.sha1(str(data_dir.resolve()).encode()).hexdigest()[:8]
+    return CACHE_DIR / f"processed-{dir_key}-{digest.hexdigest()[:16]}.feather"
+
+
+def _encode_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add label columns and compact dtypes to trips with calendar fields
+
+    Args:
+        df: Trip data with year, month, quarter and day_of_week columns
+
+    Returns:
+        The same DataFrame with day/period labels, day type and encoded columns
+    """
+    year = df["year"].to_numpy()
+    month = df["month"].to_numpy()
+    quarter = df["quarter"].to_numpy()
+    day_of_week = df["day_of_week"].to_numpy()
+
+    df["day_name"] = pd.Categorical.from_codes(day_of_week, categories=DAY_NAMES)
+    df["year_quarter"] = _period_labels(year, quarter, 4, "{}-Q{}")
+    df["year_month"] = _period_labels(year, month, 12, "{}-{:02d}")
+
+    # Add day type (weekday vs weekend)
+    is_weekend = day_of_week >= 5
+    df["is_weekend"] = is_weekend
+    df["day_type"] = pd.Categorical.from_codes(
+        is_weekend.astype(np.int8), categories=["Weekday", "Weekend"]
+    )
+
+    # Encode stations on one shared set of categories so their codes line up.
+    # A single missing station reads its column as float64; keep integral ids
+    # as integers so categories stay 3001 rather than 3001.0
+    stations = pd.Index(df["start_station"].dropna().unique()).union(
+        pd.Index(df["end_station"].dropna().unique())
+    )
+    if stations.dtype.kind == "f" and (stations % 1 == 0).all():
+        stations = stations.astype(np.int64)
+    station_dtype = pd.CategoricalDtype(stations)
+    df["start_station"] = df["start_station"].astype(station_dtype)
+    df["end_station"] = df["end_station"].astype(station_dtype)
+
+    # Bike ids group and count through their category codes
+    df["bike_id"] = df["bike_id"].astype("category")
+
+    if "passholder_type" in df.columns:
+        df["passholder_type"] = df["passholder_type"].astype("category")
+
+    df["source_file"] = df["source_file"].astype("category")
+
+    # Durations are capped at MAX_TRIP_DURATION minutes: whole minutes fit
+    # int16 exactly (sums still accumulate in int64), fractional ones
+    # float32
+    if pd.api.types.is_integer_dtype(df["duration"]):
+        df["duration"] = df["duration"].astype(np.int16)
+    else:
+        df["duration"] = df["duration"].astype(np.float32)
+
+    return df
+
+
+def _process_with_polars(data_dir: Path) -> pd.DataFrame:
+    """
+    Load trips and derive calendar fields in one lazy Polars plan
+
+    The duration filter and column selection are pushed into the Parquet scan;
+    the result is handed back to pandas for the shared label encoding.
+
+    Args:
+        data_dir: Path to directory containing Parquet files
+
+    Returns:
+        Trip data with calendar fields, ready for _encode_derived_columns
+    """
+    lf = pl.scan_parquet(
+        str(data_dir / "**" / "*.parquet"),
+        hive_partitioning=False,
+        include_file_paths="source_file",
+    )
+    schema = lf.collect_schema()
+
+    lf = lf.filter(
+        pl.col("duration").is_between(MIN_TRIP_DURATION, MAX_TRIP_DURATION)
+    ).select([c for c in TRIP_COLUMNS if c in schema.names()] + ["source_file"])
+
+    for column in ("start_time", "end_time"):
+        if schema[column] == pl.String:
+            lf = lf.with_columns(pl.col(column).str.to_datetime(strict=False))
+
+    start = pl.col("start_time")
+    lf = (
+        lf.with_columns(
+            pl.col("start_time", "end_time").cast(pl.Datetime("ns")),
+            pl.col("source_file").str.extract(r"([^/\\]+)$"),
+        )
+        .filter(start.is_not_null())
+        .with_columns(
+            start.dt.year().cast(pl.Int16).alias("year"),
+            start.dt.month().cast(pl.Int8).alias("month"),
+            start.dt.day().cast(pl.Int8).alias("day"),
+            start.dt.hour().cast(pl.Int8).alias("hour"),
+            (start.dt.weekday() - 1).cast(pl.Int8).alias("day_of_week"),
+            start.dt.quarter().cast(pl.Int8).alias("quarter"),
+        )
+    )
+
+    return lf.collect().to_pandas()
 
 
 class DataLoader:
@@ -24,6 +265,8 @@ class DataLoader:
         self.raw_data = None
         self.processed_data = None
         self.summary_data = None
+        # Identifies the files processed_data came from, for keying caches
+        self.data_version = None
 
     @staticmethod
     @st.cache_data(ttl=3600, show_spinner="Loading Parquet files...")
@@ -31,74 +274,188 @@ class DataLoader:
         """
         Load all Parquet files from data directory and combine into single DataFrame
 
+        Only TRIP_COLUMNS are decoded, and the trip duration range is pushed
+        down into the scan, so row groups outside it are skipped.
+
         Args:
             data_dir: Path to directory containing Parquet files
 
         Returns:
-            Combined DataFrame with all trip data
+            Combined DataFrame with all valid-duration trip data
         """
         parquet_paths = sorted(data_dir.rglob("*.parquet"))
 
         if not parquet_paths:
             raise FileNotFoundError(f"No Parquet files found in {data_dir}")
 
-        dfs = []
+        # Read only the footers up front so unreadable files can be skipped
+        readable, schemas = [], []
         for f in parquet_paths:
             try:
-                df = pd.read_parquet(f, engine='pyarrow')
-                df["source_file"] = f.name
-                dfs.append(df)
+                schemas.append(pq.read_schema(f))
+                readable.append(f)
             except Exception as e:
                 st.warning(f"Error loading {f.name}: {e}")
                 continue
 
-        if not dfs:
+        if not readable:
             raise ValueError("No data was successfully loaded")
 
-        data = pd.concat(dfs, ignore_index=True)
+        # Scan every file as a single Arrow dataset so decoding runs
+        # multithreaded in C++ instead of one pandas frame per file
+        parquet_format = ds.ParquetFileFormat(
+            default_fragment_scan_options=ds.ParquetFragmentScanOptions(
+                pre_buffer=True
+            )
+        )
+        schema = _unify_schemas(schemas)
+
+        # Read the year=YYYY/ directories the converter writes as a hive dataset
+        partitioned = all(f.parent.name.startswith("year=") for f in readable)
+        if partitioned and "year" not in schema.names:
+            schema = schema.append(YEAR_PARTITIONING.schema.field("year"))
+
+        dataset = ds.dataset(
+            [str(f) for f in readable],
+            schema=schema,
+            format=parquet_format,
+            partitioning=YEAR_PARTITIONING if partitioned else None,
+            partition_base_dir=str(data_dir) if partitioned else None,
+        )
+        row_filter = (ds.field("duration") >= MIN_TRIP_DURATION) & (
+            ds.field("duration") <= MAX_TRIP_DURATION
+        )
+
+        scanner = dataset.scanner(
+            columns=[c for c in TRIP_COLUMNS if c in dataset.schema.names],
+            filter=row_filter,
+            use_threads=True,
+        )
+        file_codes = {path: code for code, path in enumerate(dataset.files)}
+
+        batches, source_codes = [], []
+        for tagged in scanner.scan_batches():
+            batch = tagged.record_batch
+            batches.append(batch)
+            code = file_codes[tagged.fragment.path]
+            source_codes.append(np.full(batch.num_rows, code, dtype=np.int32))
+
+        table = pa.Table.from_batches(batches, schema=scanner.projected_schema)
+
+        # Tag rows with their file as a dictionary column (one int per row)
+        source_file = pa.DictionaryArray.from_arrays(
+            np.concatenate(source_codes) if source_codes else np.array([], np.int32),
+            [Path(path).name for path in dataset.files],
+        )
+        table = table.append_column("source_file", source_file)
+
+        # Hand the buffers over to pandas without keeping a second copy
+        data = table.to_pandas(self_destruct=True, split_blocks=True)
         return data
 
     @staticmethod
     @st.cache_data(ttl=3600, show_spinner="Processing trip data...")
-    def clean_and_process(data: pd.DataFrame) -> pd.DataFrame:
+    def clean_and_process(df: pd.DataFrame) -> pd.DataFrame:
         """
         Clean and process raw trip data
 
+        The frame is modified in place; load_data hands out a fresh frame per
+        call, so no defensive copy is made.
+
         Args:
-            data: Raw trip data DataFrame
+            df: Raw trip data DataFrame
 
         Returns:
             Cleaned and processed DataFrame
         """
-        # Create a copy to avoid modifying original
-        df = data.copy()
-
         # Convert datetime columns
         df["start_time"] = pd.to_datetime(df["start_time"], errors="coerce")
         df["end_time"] = pd.to_datetime(df["end_time"], errors="coerce")
 
-        # Filter valid trip durations
-        df = df[
-            (df["duration"] >= MIN_TRIP_DURATION)
-            & (df["duration"] <= MAX_TRIP_DURATION)
-        ]
-
-        # Extract temporal features
-        df["year"] = df["start_time"].dt.year
-        df["month"] = df["start_time"].dt.month
-        df["day"] = df["start_time"].dt.day
-        df["hour"] = df["start_time"].dt.hour
-        df["day_of_week"] = df["start_time"].dt.dayofweek  # 0=Monday, 6=Sunday
-        df["day_name"] = df["start_time"].dt.day_name()
-        df["quarter"] = ((df["month"] - 1) // 3 + 1).astype(int)
-        df["year_quarter"] = df["year"].astype(str) + "-Q" + df["quarter"].astype(str)
-        df["year_month"] = df["start_time"].dt.to_period("M").astype(str)
-
-        # Add day type (weekday vs weekend)
-        df["is_weekend"] = df["day_of_week"].isin([5, 6])
-        df["day_type"] = df["is_weekend"].map({True: "Weekend", False: "Weekday"})
-
-        return df
+        # Drop trips whose start time could not be parsed
+        if df["start_time"].isna().any():
+            df = df[df["start_time"].notna()].copy()
+
+        # Extract temporal features in one fused pass over the start timestamps
+        start = df["start_time"].to_numpy(dtype="datetime64[ns]")
+        year, month, day, hour, day_of_week, quarter = temporal_features(start)
+
+        df["year"] = year
+        df["month"] = month
+        df["day"] = day
+        df["hour"] = hour
+        df["day_of_week"] = day_of_week  # 0=Monday, 6=Sunday
+        df["quarter"] = quarter
+
+        return _encode_derived_columns(df)
+
+    @staticmethod
+    def build_processed_data(data_dir: Path) -> pd.DataFrame:
+        """
+        Process the Parquet files from scratch, bypassing every cache
+
+        Args:
+            data_dir: Path to directory containing Parquet files
+
+        Returns:
+            Cleaned and processed DataFrame with a fresh RangeIndex
+        """
+        processed = None
+        if USE_POLARS and pl is not None:
+            try:
+                processed = _encode_derived_columns(_process_with_polars(data_dir))
+            except pl.exceptions.PolarsError:
+                # Schemas Polars cannot reconcile fall back to the Arrow loader
+                processed = None
+
+        if processed is None:
+            processed = DataLoader.clean_and_process(DataLoader.load_data(data_dir))
+        return processed.reset_index(drop=True)
+
+    @staticmethod
+    @st.cache_data(ttl=3600, show_spinner="Loading processed trip data...")
+    def load_processed_data(data_dir: Path) -> pd.DataFrame:
+        """
+        Load processed trip data, reusing the on-disk Feather cache when the
+        Parquet inputs are unchanged so restarts skip clean_and_process
+
+        Args:
+            data_dir: Path to directory containing Parquet files
+
+        Returns:
+            Cleaned and processed DataFrame
+        """
+        cache_path = _processed_cache_path(data_dir)
+        if cache_path.exists():
+            try:
+                return pd.read_feather(cache_path)
+            except (OSError, pa.ArrowInvalid):
+                # An unreadable cache file is a miss; it is replaced below
+                pass
+
+        processed = DataLoader.build_processed_data(data_dir)
+
+        tmp_path = None
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Only this data directory's older cache files are stale
+            dir_key = cache_path.name.split("-")[1]
+            for stale in CACHE_DIR.glob(f"processed-{dir_key}-*.feather"):
+                if stale != cache_path:
+                    stale.unlink()
+            # Write next to the final path and rename, so a crash mid-write
+            # never leaves a truncated file under a valid digest
+            fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".feather.tmp")
+            os.close(fd)
+            tmp_path = Path(tmp_name)
+            processed.to_feather(tmp_path, compression="zstd")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # A read-only deployment simply runs without the disk cache
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+        return processed
 
     @staticmethod
     @st.cache_data(ttl=3600, show_spinner="Calculating quarterly summaries...")
@@ -112,8 +469,15 @@ class DataLoader:
         Returns:
             Quarterly summary DataFrame
         """
+        # Group on an integer year/quarter key so ordering is a plain int sort
+        yq_key = pd.Series(
+            data["year"].to_numpy(dtype=np.int64) * 10 + data["quarter"].to_numpy(),
+            index=data.index,
+            name="yq_key",
+        )
+
         summary = (
-            data.groupby("year_quarter")
+            data.groupby(yq_key, sort=True)
             .agg(
                 trips=("trip_id", "count"),
                 total_minutes=("duration", "sum"),
@@ -125,14 +489,15 @@ class DataLoader:
             .reset_index()
         )
 
-        # Sort chronologically
-        def sort_key(yq: str):
-            y, q = yq.split("-Q")
-            return (int(y), int(q))
-
-        summary = summary.sort_values(
-            "year_quarter", key=lambda s: s.map(sort_key)
-        ).reset_index(drop=True)
+        # Format the labels once per quarter from the already sorted key
+        summary.insert(
+            0,
+            "year_quarter",
+            (summary["yq_key"] // 10).astype(str)
+            + "-Q"
+            + (summary["yq_key"] % 10).astype(str),
+        )
+        summary = summary.drop(columns="yq_key")
 
         # Calculate growth metrics
         summary["trips_growth_qoq"] = summary["trips"].pct_change() * 100
@@ -148,9 +513,9 @@ class DataLoader:
         summary["avg_duration_growth_yoy"] = summary["avg_duration"].pct_change(4) * 100
 
         # Calculate rolling metrics
-        summary["rolling_year_trips"] = summary["trips"].rolling(window=4).sum()
+        summary["rolling_year_trips"] = _rolling_sum(summary["trips"].to_numpy(), 4)
         summary["rolling_avg_duration"] = (
-            summary["avg_duration"].rolling(window=4).mean()
+            _rolling_sum(summary["avg_duration"].to_numpy(), 4) / 4
         )
 
         return summary
@@ -167,19 +532,56 @@ class DataLoader:
         Returns:
             Station summary DataFrame
         """
-        start_stats = data.groupby("start_station").agg(
-            departures=("trip_id", "count"), avg_trip_duration=("duration", "mean")
+        start_dtype = data["start_station"].dtype
+        if isinstance(start_dtype, pd.CategoricalDtype) and (
+            start_dtype == data["end_station"].dtype
+        ):
+            # clean_and_process already encodes both columns on shared codes
+            start_codes = data["start_station"].cat.codes.to_numpy()
+            end_codes = data["end_station"].cat.codes.to_numpy()
+            stations = start_dtype.categories
+        else:
+            # Factorize once and map end stations onto the same station codes
+            start_codes, stations = pd.factorize(data["start_station"])
+            end_stations = data["end_station"]
+            end_codes = stations.get_indexer(end_stations)
+
+            # Stations that only ever appear as a destination get appended codes
+            unseen = (end_codes < 0) & end_stations.notna().to_numpy()
+            if unseen.any():
+                extra_codes, extra = pd.factorize(end_stations[unseen])
+                end_codes[unseen] = extra_codes + len(stations)
+                stations = stations.append(extra)
+
+        n_stations = len(stations)
+        has_start = start_codes >= 0
+        departures = np.bincount(start_codes[has_start], minlength=n_stations)
+        duration_total = np.bincount(
+            start_codes[has_start],
+            weights=data["duration"].to_numpy()[has_start],
+            minlength=n_stations,
         )
+        arrivals = np.bincount(end_codes[end_codes >= 0], minlength=n_stations)
 
-        end_stats = data.groupby("end_station").agg(arrivals=("trip_id", "count"))
+        avg_trip_duration = np.divide(
+            duration_total,
+            departures,
+            out=np.zeros(n_stations),
+            where=departures > 0,
+        )
 
-        station_summary = start_stats.join(end_stats, how="outer").fillna(0)
-        station_summary["total_activity"] = (
-            station_summary["departures"] + station_summary["arrivals"]
+        station_summary = pd.DataFrame(
+            {
+                "start_station": stations,
+                "departures": departures,
+                "avg_trip_duration": avg_trip_duration,
+                "arrivals": arrivals,
+                "total_activity": departures + arrivals,
+            }
         )
         station_summary = station_summary.sort_values("total_activity", ascending=False)
 
-        return station_summary.reset_index()
+        return station_summary.reset_index(drop=True)
 
     @staticmethod
     @st.cache_data(ttl=3600)
@@ -194,7 +596,7 @@ class DataLoader:
             Hourly pattern DataFrame
         """
         hourly = (
-            data.groupby(["hour", "day_type"])
+            data.groupby(["hour", "day_type"], observed=True)
             .agg(trips=("trip_id", "count"), avg_duration=("duration", "mean"))
             .reset_index()
         )
@@ -214,7 +616,7 @@ class DataLoader:
             Daily pattern DataFrame
         """
         daily = (
-            data.groupby(["day_name", "day_of_week"])
+            data.groupby(["day_name", "day_of_week"], observed=True)
             .agg(trips=("trip_id", "count"), avg_duration=("duration", "mean"))
             .reset_index()
             .sort_values("day_of_week")
@@ -222,16 +624,16 @@ class DataLoader:
 
         return daily
 
-    def filter_data(
+    def filter_mask(
         self,
         data: pd.DataFrame,
         years: List[int] = None,
         quarters: List[int] = None,
         months: List[int] = None,
         day_types: List[str] = None,
-    ) -> pd.DataFrame:
+    ) -> np.ndarray:
         """
-        Filter data based on various criteria
+        Build a boolean row mask for various criteria without copying rows
 
         Args:
             data: DataFrame to filter
@@ -241,41 +643,90 @@ class DataLoader:
             day_types: List of day types to include
 
         Returns:
-            Filtered DataFrame
+            Boolean array marking the rows that match every criterion
         """
-        filtered = data.copy()
+        mask = np.ones(len(data), dtype=bool)
 
         if years:
-            filtered = filtered[filtered["year"].isin(years)]
+            mask &= data["year"].isin(years).to_numpy()
 
         if quarters:
-            filtered = filtered[filtered["quarter"].isin(quarters)]
+            mask &= data["quarter"].isin(quarters).to_numpy()
 
         if months:
-            filtered = filtered[filtered["month"].isin(months)]
+            mask &= data["month"].isin(months).to_numpy()
 
         if day_types:
-            filtered = filtered[filtered["day_type"].isin(day_types)]
+            mask &= data["day_type"].isin(day_types).to_numpy()
+
+        return mask
+
+    def filter_data(
+        self,
+        data: pd.DataFrame,
+        years: List[int] = None,
+        quarters: List[int] = None,
+        months: List[int] = None,
+        day_types: List[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Filter data based on various criteria
 
-        return filtered
+        Args:
+            data: DataFrame to filter
+            years: List of years to include
+            quarters: List of quarters to include
+            months: List of months to include
+            day_types: List of day types to include
 
-    def get_full_pipeline(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        Returns:
+            Filtered DataFrame
+        """
+        # One combined mask materializes the result once
+        return data[self.filter_mask(data, years, quarters, months, day_types)]
+
+    @staticmethod
+    @st.cache_data(ttl=3600, show_spinner="Loading prebuilt trip data...")
+    def load_prebuilt() -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Load the processed and summary data written by scripts/build_processed.py
+
+        Returns:
+            Tuple of (processed_data, summary_data)
+        """
+        return pd.read_feather(PROCESSED_FILE), pd.read_feather(SUMMARY_FILE)
+
+    def get_full_pipeline(
+        self, use_prebuilt: bool = True
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Execute complete data loading and processing pipeline
 
+        Args:
+            use_prebuilt: Read the build-time output for the default data
+                directory when it exists instead of processing the Parquet files
+
         Returns:
             Tuple of (processed_data, summary_data)
         """
-        # Load raw data (cached)
-        raw_data = DataLoader.load_data(self.data_dir)
-        self.raw_data = raw_data
+        if (
+            use_prebuilt
+            and self.data_dir == DATA_DIR
+            and PROCESSED_FILE.exists()
+            and SUMMARY_FILE.exists()
+        ):
+            processed_data, summary_data = DataLoader.load_prebuilt()
+            data_version = f"{PROCESSED_FILE}:{PROCESSED_FILE.stat().st_mtime_ns}"
+        else:
+            # Load and process raw data (cached in memory and on disk)
+            processed_data = DataLoader.load_processed_data(self.data_dir)
+
+            # Generate summary (cached)
+            summary_data = DataLoader.generate_quarterly_summary(processed_data)
+            data_version = str(_processed_cache_path(self.data_dir))
 
-        # Clean and process (cached)
-        processed_data = DataLoader.clean_and_process(raw_data)
         self.processed_data = processed_data
-
-        # Generate summary (cached)
-        summary_data = DataLoader.generate_quarterly_summary(processed_data)
         self.summary_data = summary_data
+        self.data_version = data_version
 
         return processed_data, summary_data
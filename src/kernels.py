@@ -0,0 +1,139 @@
+"""
+Numeric kernels for Indego Bike Share data processing
+
+Numba is optional: when it is installed the kernels are JIT-compiled into a
+single parallel pass, otherwise equivalent NumPy implementations are used.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import get_num_threads, njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+NS_PER_DAY = 86_400_000_000_000
+NS_PER_HOUR = 3_600_000_000_000
+
+# Bucket layout of the combined hour / day-of-week / month histogram
+HOUR_BUCKETS = 24
+DAY_BUCKETS = 7
+MONTH_BUCKETS = 12
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _temporal_features_numba(ts_ns):
+        n = ts_ns.shape[0]
+        year = np.empty(n, dtype=np.int16)
+        month = np.empty(n, dtype=np.int8)
+        day = np.empty(n, dtype=np.int8)
+        hour = np.empty(n, dtype=np.int8)
+        day_of_week = np.empty(n, dtype=np.int8)
+        quarter = np.empty(n, dtype=np.int8)
+
+        for i in prange(n):
+            days = ts_ns[i] // NS_PER_DAY
+            hour[i] = (ts_ns[i] - days * NS_PER_DAY) // NS_PER_HOUR
+            day_of_week[i] = (days + 3) % 7  # 1970-01-01 was a Thursday
+
+            # Civil date from days since epoch (Howard Hinnant's algorithm)
+            z = days + 719468
+            era = z // 146097
+            doe = z - era * 146097
+            yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+            doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+            mp = (5 * doy + 2) // 153
+            m = mp + 3 if mp < 10 else mp - 9
+
+            year[i] = yoe + era * 400 + (1 if m <= 2 else 0)
+            month[i] = m
+            day[i] = doy - (153 * mp + 2) // 5 + 1
+            quarter[i] = (m - 1) // 3 + 1
+
+        return year, month, day, hour, day_of_week, quarter
+
+    @njit(parallel=True, cache=True)
+    def _time_bucket_counts_numba(hour, day_of_week, month, n_chunks):
+        n = hour.shape[0]
+        step = (n + n_chunks - 1) // n_chunks
+        day_offset = HOUR_BUCKETS
+        month_offset = HOUR_BUCKETS + DAY_BUCKETS - 1  # months are 1-based
+
+        # One private histogram row per chunk avoids racing on shared counters
+        counts = np.zeros(
+            (n_chunks, HOUR_BUCKETS + DAY_BUCKETS + MONTH_BUCKETS), dtype=np.int64
+        )
+        for c in prange(n_chunks):
+            for i in range(c * step, min(n, (c + 1) * step)):
+                counts[c, hour[i]] += 1
+                counts[c, day_offset + day_of_week[i]] += 1
+                counts[c, month_offset + month[i]] += 1
+
+        totals = counts.sum(axis=0)
+        return (
+            totals[:HOUR_BUCKETS],
+            totals[HOUR_BUCKETS : HOUR_BUCKETS + DAY_BUCKETS],
+            totals[HOUR_BUCKETS + DAY_BUCKETS :],
+        )
+
+
+def _temporal_features_numpy(start: np.ndarray) -> Tuple[np.ndarray, ...]:
+    month_start = start.astype("datetime64[M]")
+    day_start = start.astype("datetime64[D]")
+    months = month_start.astype(np.int64)
+    days = day_start.astype(np.int64)
+
+    month = months % 12 + 1
+    return (
+        (months // 12 + 1970).astype(np.int16),
+        month.astype(np.int8),
+        ((day_start - month_start).astype(np.int64) + 1).astype(np.int8),
+        (start - day_start).astype("timedelta64[h]").astype(np.int8),
+        ((days + 3) % 7).astype(np.int8),  # 1970-01-01 was a Thursday
+        ((month - 1) // 3 + 1).astype(np.int8),
+    )
+
+
+def temporal_features(start: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Derive calendar fields from trip start timestamps in one pass
+
+    Args:
+        start: datetime64[ns] array without NaT values
+
+    Returns:
+        Tuple of (year, month, day, hour, day_of_week, quarter) arrays;
+        year is int16, the rest int8, and day_of_week is 0=Monday, 6=Sunday
+    """
+    if NUMBA_AVAILABLE:
+        return _temporal_features_numba(start.view(np.int64))
+    return _temporal_features_numpy(start)
+
+
+def time_bucket_counts(
+    hour: np.ndarray, day_of_week: np.ndarray, month: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count trips per hour, day of week and month in one pass
+
+    Args:
+        hour: Hour of day (0-23) per trip
+        day_of_week: Day of week (0=Monday, 6=Sunday) per trip
+        month: Month (1-12) per trip
+
+    Returns:
+        Tuple of int64 count arrays of length 24, 7 and 12 (January first)
+    """
+    if NUMBA_AVAILABLE:
+        return _time_bucket_counts_numba(hour, day_of_week, month, get_num_threads())
+    return (
+        np.bincount(hour, minlength=HOUR_BUCKETS),
+        np.bincount(day_of_week, minlength=DAY_BUCKETS),
+        np.bincount(month, minlength=MONTH_BUCKETS + 1)[1:],
+    )
@@ -4,7 +4,54 @@ Metrics calculation module for Indego Bike Share analytics
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Tuple, Any
+from functools import lru_cache
+from typing import Callable, Dict, Tuple, Any
+
+from config import DAY_NAMES
+from kernels import time_bucket_counts
+
+
+MILLION = 1_000_000
+THOUSAND = 1_000
+
+
+@lru_cache(maxsize=None)
+def _number_formats(decimal_places: int) -> Tuple[Callable[[float], str], ...]:
+    """
+    Build the million/thousand/unit formatters for a number of decimals once
+
+    Args:
+        decimal_places: Number of decimal places
+
+    Returns:
+        Tuple of (millions, thousands, units) bound str.format methods
+    """
+    return (
+        f"{{:.{decimal_places}f}}M".format,
+        f"{{:.{decimal_places}f}}K".format,
+        f"{{:.{decimal_places}f}}".format,
+    )
+
+
+def _count_unique(values: pd.Series) -> int:
+    """
+    Count distinct non-null values, using category codes when available
+
+    The station and bike categories can include values absent from this data
+    (e.g. end-only stations), so observed codes are counted rather than
+    taking the size of the categories.
+
+    Args:
+        values: Column to count
+
+    Returns:
+        Number of distinct non-null values
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+        return int(np.count_nonzero(counts))
+    return values.nunique()
 
 
 class MetricsCalculator:
@@ -15,22 +62,36 @@ class MetricsCalculator:
         """
         Calculate key performance indicators from trip data
 
+        Durations arrive down-cast by clean_and_process: whole minutes as int16
+        are exact, fractional minutes as float32 carry a relative rounding error
+        below 1e-7 per trip. Totals and averages accumulate in int64/float64,
+        so avg_trip_duration stays within 1e-6 of a float64 computation.
+
         Args:
             data: Processed trip data DataFrame
 
         Returns:
             Dictionary of KPI values
         """
+        durations = data["duration"].to_numpy()
+        trips = durations.size
+
+        # Accumulate int16 minutes in int64 and float32 minutes in float64
+        if np.issubdtype(durations.dtype, np.integer):
+            total_minutes = durations.sum(dtype=np.int64)
+        else:
+            total_minutes = durations.sum(dtype=np.float64)
+
         kpis = {
-            "total_trips": len(data),
-            "total_ride_minutes": data["duration"].sum(),
-            "avg_trip_duration": data["duration"].mean(),
-            "median_trip_duration": data["duration"].median(),
-            "unique_bikes": data["bike_id"].nunique(),
-            "unique_stations": data["start_station"].nunique(),
-            "total_ride_hours": data["duration"].sum() / 60,
-            "max_trip_duration": data["duration"].max(),
-            "min_trip_duration": data["duration"].min(),
+            "total_trips": trips,
+            "total_ride_minutes": total_minutes,
+            "avg_trip_duration": total_minutes / trips if trips > 0 else np.nan,
+            "median_trip_duration": np.median(durations) if trips > 0 else np.nan,
+            "unique_bikes": _count_unique(data["bike_id"]),
+            "unique_stations": _count_unique(data["start_station"]),
+            "total_ride_hours": total_minutes / 60,
+            "max_trip_duration": durations.max() if trips > 0 else np.nan,
+            "min_trip_duration": durations.min() if trips > 0 else np.nan,
         }
 
         return kpis
@@ -46,17 +107,29 @@ class MetricsCalculator:
         Returns:
             Dictionary of growth metrics
         """
+        growth_columns = [
+            "trips_growth_qoq",
+            "trips_growth_yoy",
+            "total_minutes_growth_qoq",
+            "total_minutes_growth_yoy",
+        ]
+
+        # One column-wise reduction that skips the leading pct_change gaps the
+        # way Series.mean() does; a column with no values averages to NaN
+        growth = summary[growth_columns].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(growth)
+        with np.errstate(invalid="ignore"):
+            growth_means = np.where(valid, growth, 0).sum(axis=0) / valid.sum(axis=0)
+        qoq_trips, yoy_trips, qoq_minutes, yoy_minutes = growth_means
+
+        trips = summary["trips"]
         metrics = {
-            "avg_qoq_trips_growth": summary["trips_growth_qoq"].mean(),
-            "avg_yoy_trips_growth": summary["trips_growth_yoy"].mean(),
-            "avg_qoq_minutes_growth": summary["total_minutes_growth_qoq"].mean(),
-            "avg_yoy_minutes_growth": summary["total_minutes_growth_yoy"].mean(),
+            "avg_qoq_trips_growth": qoq_trips,
+            "avg_yoy_trips_growth": yoy_trips,
+            "avg_qoq_minutes_growth": qoq_minutes,
+            "avg_yoy_minutes_growth": yoy_minutes,
             "total_growth_rate": (
-                (
-                    (summary["trips"].iloc[-1] - summary["trips"].iloc[0])
-                    / summary["trips"].iloc[0]
-                    * 100
-                )
+                (trips.iat[-1] - trips.iat[0]) / trips.iat[0] * 100
                 if len(summary) > 0
                 else 0
             ),
@@ -83,14 +156,21 @@ class MetricsCalculator:
         Returns:
             Dictionary of comparison metrics
         """
-        current_data = data[data[period_column] == current_period]
-        previous_data = data[data[period_column] == previous_period]
-
-        current_trips = len(current_data)
-        previous_trips = len(previous_data)
-
-        current_minutes = current_data["duration"].sum()
-        previous_minutes = previous_data["duration"].sum()
+        # Both periods come out of one grouped pass instead of two mask copies
+        by_period = data.groupby(period_column, sort=False, observed=True)[
+            "duration"
+        ].agg(trips="size", minutes="sum")
+
+        try:
+            current_trips = int(by_period.at[current_period, "trips"])
+            current_minutes = by_period.at[current_period, "minutes"]
+        except KeyError:
+            current_trips, current_minutes = 0, 0
+        try:
+            previous_trips = int(by_period.at[previous_period, "trips"])
+            previous_minutes = by_period.at[previous_period, "minutes"]
+        except KeyError:
+            previous_trips, previous_minutes = 0, 0
 
         trips_change = (
             (current_trips - previous_trips) / previous_trips * 100
@@ -123,18 +203,26 @@ class MetricsCalculator:
         Returns:
             DataFrame with seasonality indices
         """
-        # Extract quarter number
-        summary_copy = summary.copy()
-        summary_copy["quarter_num"] = summary_copy["year_quarter"].apply(
-            lambda x: int(x.split("-Q")[1])
-        )
+        # Quarter number straight from a period column, else parsed from labels
+        year_quarter = summary["year_quarter"]
+        if isinstance(year_quarter.dtype, pd.PeriodDtype):
+            quarter_num = year_quarter.dt.quarter.to_numpy()
+        else:
+            quarter_num = (
+                year_quarter.str.rsplit("-Q", n=1).str[1].astype(np.int8).to_numpy()
+            )
 
-        # Calculate average trips per quarter across all years
-        avg_by_quarter = summary_copy.groupby("quarter_num")["trips"].mean()
-        overall_avg = summary_copy["trips"].mean()
+        # Average trips per quarter across all years
+        trips = summary["trips"].to_numpy()
+        quarter_counts = np.bincount(quarter_num, minlength=5)
+        quarter_trips = np.bincount(quarter_num, weights=trips, minlength=5)
+        quarters = np.flatnonzero(quarter_counts)
+        avg_by_quarter = quarter_trips[quarters] / quarter_counts[quarters]
 
         # Calculate seasonality index
-        seasonality = (avg_by_quarter / overall_avg * 100).to_dict()
+        seasonality = dict(
+            zip(quarters.tolist(), (avg_by_quarter / trips.mean() * 100).tolist())
+        )
 
         return seasonality
 
@@ -149,21 +237,28 @@ class MetricsCalculator:
         Returns:
             Dictionary of utilization metrics
         """
-        # Trips per bike
-        bike_usage = data.groupby("bike_id").size()
+        stats = ["mean", "median", "max", "min"]
+
+        # Categorical value_counts also lists unused categories (e.g. end-only
+        # stations) with a zero count; drop them so only active ones count
+
+        # Trips per bike (categorical after processing)
+        bike_usage = data["bike_id"].value_counts(sort=False)
+        bike_stats = bike_usage[bike_usage > 0].agg(stats)
 
-        # Trips per station
-        station_usage = data.groupby("start_station").size()
+        # Trips per station (categorical codes shared with end_station)
+        station_usage = data["start_station"].value_counts(sort=False)
+        station_stats = station_usage[station_usage > 0].agg(stats)
 
         metrics = {
-            "avg_trips_per_bike": bike_usage.mean(),
-            "median_trips_per_bike": bike_usage.median(),
-            "max_trips_per_bike": bike_usage.max(),
-            "min_trips_per_bike": bike_usage.min(),
-            "avg_trips_per_station": station_usage.mean(),
-            "median_trips_per_station": station_usage.median(),
-            "max_trips_per_station": station_usage.max(),
-            "min_trips_per_station": station_usage.min(),
+            "avg_trips_per_bike": bike_stats["mean"],
+            "median_trips_per_bike": bike_stats["median"],
+            "max_trips_per_bike": int(bike_stats["max"]),
+            "min_trips_per_bike": int(bike_stats["min"]),
+            "avg_trips_per_station": station_stats["mean"],
+            "median_trips_per_station": station_stats["median"],
+            "max_trips_per_station": int(station_stats["max"]),
+            "min_trips_per_station": int(station_stats["min"]),
         }
 
         return metrics
@@ -179,23 +274,75 @@ class MetricsCalculator:
         Returns:
             Dictionary of peak time information
         """
-        hourly_trips = data.groupby("hour").size()
-        daily_trips = data.groupby("day_name").size()
-        monthly_trips = data.groupby("month").size()
+        hourly_trips, daily_trips, monthly_trips = time_bucket_counts(
+            data["hour"].to_numpy(),
+            data["day_of_week"].to_numpy(),
+            data["month"].to_numpy(),
+        )
+
+        # The off-peak hour is the quietest hour that has any trips at all
+        peak_hour = int(hourly_trips.argmax())
+        peak_day = int(daily_trips.argmax())
+        peak_month = int(monthly_trips.argmax())
+        off_peak_hour = int(
+            np.where(hourly_trips > 0, hourly_trips, np.iinfo(np.int64).max).argmin()
+        )
 
         peak_info = {
-            "peak_hour": hourly_trips.idxmax(),
-            "peak_hour_trips": hourly_trips.max(),
-            "peak_day": daily_trips.idxmax(),
-            "peak_day_trips": daily_trips.max(),
-            "peak_month": monthly_trips.idxmax(),
-            "peak_month_trips": monthly_trips.max(),
-            "off_peak_hour": hourly_trips.idxmin(),
-            "off_peak_hour_trips": hourly_trips.min(),
+            "peak_hour": peak_hour,
+            "peak_hour_trips": hourly_trips[peak_hour],
+            "peak_day": DAY_NAMES[peak_day],
+            "peak_day_trips": daily_trips[peak_day],
+            "peak_month": peak_month + 1,
+            "peak_month_trips": monthly_trips[peak_month],
+            "off_peak_hour": off_peak_hour,
+            "off_peak_hour_trips": hourly_trips[off_peak_hour],
         }
 
         return peak_info
 
+    @staticmethod
+    def calculate_duration_stats(data: pd.DataFrame) -> Dict[str, float]:
+        """
+        Calculate mean, median, mode and max trip duration
+
+        Whole-minute durations are summarized from a single bincount histogram
+        rather than four separate passes over the column.
+
+        Args:
+            data: Processed trip data DataFrame
+
+        Returns:
+            Dictionary of duration statistics in minutes
+        """
+        durations = data["duration"].to_numpy()
+
+        if len(durations) == 0:
+            return {"mean": np.nan, "median": np.nan, "mode": np.nan, "max": np.nan}
+
+        if not np.issubdtype(durations.dtype, np.integer):
+            return {
+                "mean": durations.mean(dtype=np.float64),
+                "median": np.median(durations),
+                "mode": pd.Series(durations).mode().iat[0],
+                "max": durations.max(),
+            }
+
+        hist = np.bincount(durations)
+        cumulative = np.cumsum(hist)
+        total = cumulative[-1]
+
+        # Average the two middle values for an even count, as pandas does
+        lower = np.searchsorted(cumulative, (total - 1) // 2, side="right")
+        upper = np.searchsorted(cumulative, total // 2, side="right")
+
+        return {
+            "mean": np.dot(np.arange(len(hist)), hist) / total,
+            "median": (lower + upper) / 2,
+            "mode": hist.argmax(),
+            "max": len(hist) - 1,
+        }
+
     @staticmethod
     def calculate_retention_proxy(data: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -209,7 +356,18 @@ class MetricsCalculator:
         """
         # Calculate trips by user type if available
         if "passholder_type" in data.columns:
-            user_type_dist = data["passholder_type"].value_counts()
+            passholder = data["passholder_type"]
+            if isinstance(passholder.dtype, pd.CategoricalDtype):
+                # Count category codes directly; missing values are coded -1
+                codes = passholder.cat.codes.to_numpy()
+                categories = passholder.cat.categories
+                counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+                user_type_dist = pd.Series(counts, index=categories)
+                user_type_dist = user_type_dist[user_type_dist > 0].sort_values(
+                    ascending=False, kind="stable"
+                )
+            else:
+                user_type_dist = passholder.value_counts()
 
             return {
                 "user_type_distribution": user_type_dist.to_dict(),
@@ -239,12 +397,16 @@ class MetricsCalculator:
         Returns:
             Formatted string
         """
-        if num >= 1_000_000:
-            return f"{num / 1_000_000:.{decimal_places}f}M"
-        elif num >= 1_000:
-            return f"{num / 1_000:.{decimal_places}f}K"
+        format_millions, format_thousands, format_units = _number_formats(
+            decimal_places
+        )
+
+        if num >= MILLION:
+            return format_millions(num / MILLION)
+        elif num >= THOUSAND:
+            return format_thousands(num / THOUSAND)
         else:
-            return f"{num:.{decimal_places}f}"
+            return format_units(num)
 
     @staticmethod
     def format_duration(minutes: float) -> str:
@@ -2,23 +2,102 @@
 Visualization module for Indego Bike Share dashboard
 """
 
+from __future__ import annotations
+
+import functools
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import streamlit as st
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from config import CHART_STYLE, CHART_FONT_SCALE, DEFAULT_FIGURE_SIZE, COLOR_PALETTE
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+@st.cache_resource(show_spinner=False)
+def _pyplot():
+    """
+    Import pyplot on first use and apply the default chart style once
+
+    matplotlib and seaborn are slow to import, so pages that render no charts
+    never pay for them.
+
+    Returns:
+        The matplotlib.pyplot module
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Set default style
+    sns.set(style=CHART_STYLE, font_scale=CHART_FONT_SCALE)
+
+    return plt
+
+
+def _seaborn():
+    """
+    Import seaborn on first use, with the default chart style applied
+
+    Returns:
+        The seaborn module
+    """
+    _pyplot()
+    import seaborn as sns
+
+    return sns
+
+
+def _cached_figure(plot):
+    """
+    Cache a plot method's figure per set of inputs across reruns
+
+    The figure is closed in pyplot before it is cached: st.pyplot still renders
+    it, but reruns no longer accumulate open figures. st.cache_data hands every
+    caller its own unpickled copy, so concurrent sessions never call savefig
+    on the same Figure object.
 
-# Set default style
-sns.set(style=CHART_STYLE, font_scale=CHART_FONT_SCALE)
+    Args:
+        plot: Function building and returning a Matplotlib figure
+
+    Returns:
+        The cached plotting function
+    """
+
+    @functools.wraps(plot)
+    def build_figure(*args, **kwargs):
+        fig = plot(*args, **kwargs)
+        _pyplot().close(fig)
+        return fig
+
+    return st.cache_data(ttl=3600, show_spinner=False)(build_figure)
+
+
+def _as_soa(summary: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    View a summary DataFrame as a struct of arrays, one NumPy array per column
+
+    Args:
+        summary: Quarterly summary DataFrame
+
+    Returns:
+        Dictionary mapping column names to their values
+    """
+    return {column: summary[column].to_numpy() for column in summary.columns}
+
+
+def _plot_line(ax: plt.Axes, soa: Dict[str, np.ndarray], x: str, y: str, **kwargs):
+    """Draw a marked line straight from column arrays, labelled as sns.lineplot"""
+    ax.plot(soa[x], soa[y], marker="o", **kwargs)
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
 
 
 class Visualizer:
     """Class containing visualization methods for bike share data"""
 
     @staticmethod
+    @_cached_figure
     def plot_trips_per_quarter(
         summary: pd.DataFrame, figsize: Tuple[int, int] = DEFAULT_FIGURE_SIZE
     ) -> plt.Figure:
@@ -32,17 +111,18 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=figsize)
+        soa = _as_soa(summary)
 
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="trips",
-            marker="o",
+        _plot_line(
+            ax,
+            soa,
+            "year_quarter",
+            "trips",
             color=COLOR_PALETTE["primary"],
             linewidth=2.5,
             markersize=8,
-            ax=ax,
         )
 
         ax.set_title(
@@ -59,6 +139,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_ride_minutes_per_quarter(
         summary: pd.DataFrame, figsize: Tuple[int, int] = DEFAULT_FIGURE_SIZE
     ) -> plt.Figure:
@@ -72,17 +153,18 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=figsize)
+        soa = _as_soa(summary)
 
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="total_minutes",
-            marker="o",
+        _plot_line(
+            ax,
+            soa,
+            "year_quarter",
+            "total_minutes",
             color=COLOR_PALETTE["secondary"],
             linewidth=2.5,
             markersize=8,
-            ax=ax,
         )
 
         ax.set_title(
@@ -96,6 +178,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_avg_duration_per_quarter(
         summary: pd.DataFrame, figsize: Tuple[int, int] = DEFAULT_FIGURE_SIZE
     ) -> plt.Figure:
@@ -109,17 +192,18 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=figsize)
+        soa = _as_soa(summary)
 
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="avg_duration",
-            marker="o",
+        _plot_line(
+            ax,
+            soa,
+            "year_quarter",
+            "avg_duration",
             color=COLOR_PALETTE["success"],
             linewidth=2.5,
             markersize=8,
-            ax=ax,
         )
 
         ax.set_title(
@@ -133,6 +217,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_rolling_12month(
         summary: pd.DataFrame, figsize: Tuple[int, int] = DEFAULT_FIGURE_SIZE
     ) -> plt.Figure:
@@ -146,17 +231,18 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=figsize)
+        soa = _as_soa(summary)
 
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="rolling_year_trips",
-            marker="o",
+        _plot_line(
+            ax,
+            soa,
+            "year_quarter",
+            "rolling_year_trips",
             color=COLOR_PALETTE["info"],
             linewidth=2.5,
             markersize=8,
-            ax=ax,
         )
 
         ax.set_title(
@@ -170,6 +256,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_growth_rates(
         summary: pd.DataFrame, figsize: Tuple[int, int] = (12, 8)
     ) -> plt.Figure:
@@ -183,17 +270,18 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
+        soa = _as_soa(summary)
 
         # QoQ Growth
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="trips_growth_qoq",
-            marker="o",
+        _plot_line(
+            ax1,
+            soa,
+            "year_quarter",
+            "trips_growth_qoq",
             color=COLOR_PALETTE["primary"],
             linewidth=2,
-            ax=ax1,
         )
         ax1.axhline(y=0, color="red", linestyle="--", alpha=0.5)
         ax1.set_title(
@@ -204,14 +292,13 @@ class Visualizer:
         ax1.tick_params(axis="x", rotation=45)
 
         # YoY Growth
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="trips_growth_yoy",
-            marker="o",
+        _plot_line(
+            ax2,
+            soa,
+            "year_quarter",
+            "trips_growth_yoy",
             color=COLOR_PALETTE["success"],
             linewidth=2,
-            ax=ax2,
         )
         ax2.axhline(y=0, color="red", linestyle="--", alpha=0.5)
         ax2.set_title("Year-over-Year Growth Rate", fontsize=14, fontweight="bold")
@@ -223,6 +310,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_hourly_patterns(
         hourly_data: pd.DataFrame, figsize: Tuple[int, int] = DEFAULT_FIGURE_SIZE
     ) -> plt.Figure:
@@ -236,6 +324,8 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
+        sns = _seaborn()
         fig, ax = plt.subplots(figsize=figsize)
 
         sns.lineplot(
@@ -261,6 +351,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_daily_patterns(
         daily_data: pd.DataFrame, figsize: Tuple[int, int] = DEFAULT_FIGURE_SIZE
     ) -> plt.Figure:
@@ -274,6 +365,8 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
+        sns = _seaborn()
         fig, ax = plt.subplots(figsize=figsize)
 
         sns.barplot(data=daily_data, x="day_name", y="trips", palette="viridis", ax=ax)
@@ -289,6 +382,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_top_stations(
         station_data: pd.DataFrame,
         top_n: int = 15,
@@ -305,9 +399,23 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
+        sns = _seaborn()
         fig, ax = plt.subplots(figsize=figsize)
 
-        top_stations = station_data.nlargest(top_n, "total_activity")
+        # Partial sort: find the cutoff value in O(n) and order only the rows
+        # that make it, taking ties at the cutoff by position as nlargest does
+        activity = station_data["total_activity"].to_numpy()
+        k = min(top_n, len(activity))
+        if k > 0:
+            cutoff = np.partition(activity, len(activity) - k)[len(activity) - k]
+            above = np.flatnonzero(activity > cutoff)
+            at_cutoff = np.flatnonzero(activity == cutoff)[: k - len(above)]
+            top = np.concatenate([above, at_cutoff])
+            top = top[np.lexsort((top, -activity[top]))]
+        else:
+            top = np.array([], dtype=np.intp)
+        top_stations = station_data.iloc[top]
 
         sns.barplot(
             data=top_stations,
@@ -332,6 +440,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_duration_distribution(
         data: pd.DataFrame, figsize: Tuple[int, int] = DEFAULT_FIGURE_SIZE
     ) -> plt.Figure:
@@ -345,13 +454,23 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=figsize)
 
         # Plot distribution (limiting to 60 minutes for better visualization)
-        duration_sample = data[data["duration"] <= 60]["duration"]
-
-        sns.histplot(
-            duration_sample, bins=60, color=COLOR_PALETTE["primary"], alpha=0.7, ax=ax
+        durations = data["duration"].to_numpy()
+        duration_sample = durations[durations <= 60]
+
+        # Durations are whole minutes: one bin per minute from 0 to 60 inclusive
+        counts, edges = np.histogram(duration_sample, bins=np.arange(0, 62))
+        ax.bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align="edge",
+            color=COLOR_PALETTE["primary"],
+            alpha=0.7,
+            edgecolor="white",
         )
 
         ax.set_title(
@@ -367,6 +486,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_monthly_heatmap(
         data: pd.DataFrame, figsize: Tuple[int, int] = (14, 8)
     ) -> plt.Figure:
@@ -380,10 +500,25 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
-        # Create pivot table for heatmap
-        monthly_pivot = data.groupby(["year", "month"]).size().reset_index(name="trips")
-        pivot_table = monthly_pivot.pivot(index="month", columns="year", values="trips")
+        # Count trips per (month, year) cell with one integer bincount
+        year = data["year"].to_numpy()
+        month = data["month"].to_numpy()
+        first_year = int(year.min())
+        n_years = int(year.max()) - first_year + 1
+        cell = (month.astype(np.int64) - 1) * n_years + (year - first_year)
+        counts = np.bincount(cell, minlength=12 * n_years).reshape(12, n_years)
+
+        # Keep only years with trips and leave empty months blank, as a pivot did
+        observed = counts.any(axis=0)
+        years = np.arange(first_year, first_year + n_years)[observed]
+        pivot_table = pd.DataFrame(
+            np.where(counts > 0, counts, np.nan)[:, observed],
+            index=pd.RangeIndex(1, 13, name="month"),
+            columns=pd.Index(years, name="year"),
+        )
 
+        plt = _pyplot()
+        sns = _seaborn()
         fig, ax = plt.subplots(figsize=figsize)
 
         sns.heatmap(
@@ -422,6 +557,7 @@ class Visualizer:
         return fig
 
     @staticmethod
+    @_cached_figure
     def plot_metrics_comparison(
         summary: pd.DataFrame, figsize: Tuple[int, int] = (14, 10)
     ) -> plt.Figure:
@@ -435,54 +571,48 @@ class Visualizer:
         Returns:
             Matplotlib figure
         """
+        plt = _pyplot()
         fig, axes = plt.subplots(2, 2, figsize=figsize)
+        soa = _as_soa(summary)
 
         # Trips
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="trips",
-            marker="o",
-            color=COLOR_PALETTE["primary"],
-            ax=axes[0, 0],
+        _plot_line(
+            axes[0, 0], soa, "year_quarter", "trips", color=COLOR_PALETTE["primary"]
         )
         axes[0, 0].set_title("Total Trips", fontweight="bold")
         axes[0, 0].tick_params(axis="x", rotation=45)
         axes[0, 0].set_xlabel("")
 
         # Total Minutes
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="total_minutes",
-            marker="o",
+        _plot_line(
+            axes[0, 1],
+            soa,
+            "year_quarter",
+            "total_minutes",
             color=COLOR_PALETTE["secondary"],
-            ax=axes[0, 1],
         )
         axes[0, 1].set_title("Total Ride Minutes", fontweight="bold")
         axes[0, 1].tick_params(axis="x", rotation=45)
         axes[0, 1].set_xlabel("")
 
         # Unique Bikes
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="unique_bikes",
-            marker="o",
+        _plot_line(
+            axes[1, 0],
+            soa,
+            "year_quarter",
+            "unique_bikes",
             color=COLOR_PALETTE["success"],
-            ax=axes[1, 0],
         )
         axes[1, 0].set_title("Unique Bikes in Use", fontweight="bold")
         axes[1, 0].tick_params(axis="x", rotation=45)
 
         # Active Stations
-        sns.lineplot(
-            data=summary,
-            x="year_quarter",
-            y="active_stations",
-            marker="o",
+        _plot_line(
+            axes[1, 1],
+            soa,
+            "year_quarter",
+            "active_stations",
             color=COLOR_PALETTE["info"],
-            ax=axes[1, 1],
         )
         axes[1, 1].set_title("Active Stations", fontweight="bold")
         axes[1, 1].tick_params(axis="x", rotation=45)
@@ -4,6 +4,7 @@ Setup verification script for Indego Bike Share Dashboard
 Run this to check if all dependencies are installed correctly
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -28,13 +29,13 @@ def check_dependencies():
 
     missing = []
 
+    # Locate each package without importing it (and all of its submodules)
     for package in required_packages:
-        try:
-            __import__(package)
-            print(f"✓ {package} is installed")
-        except ImportError:
+        if importlib.util.find_spec(package) is None:
             print(f"✗ {package} is NOT installed")
             missing.append(package)
+        else:
+            print(f"✓ {package} is installed")
 
     return len(missing) == 0, missing
 
@@ -69,6 +70,7 @@ def check_src_directory():
         "app.py",
         "config.py",
         "data_loader.py",
+        "kernels.py",
         "metrics.py",
         "visualizations.py",
     ]